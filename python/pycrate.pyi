@@ -121,6 +121,16 @@ def read_ob(obj: str, validity: bool) -> "PyRoCrate":
     :param validity: True if crate validation needed
     """
 
+def read_bytes(obj: bytes, validation_level: int) -> "PyRoCrate":
+    """
+    Reads in UTF-8 encoded json bytes of a crate into memory allowing manipulation
+
+    Avoids decoding to a str when the crate is already held as bytes
+
+    :param obj: UTF-8 encoded bytes of full RO-Crate
+    :param validation_level: 0 no validation, 1 warnings, 2 strict
+    """
+
 def zip(crate_path: str, external: bool) -> None:
     """
     Targets an RO-Crate and zip directory contents. If external is True, pulls
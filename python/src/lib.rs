@@ -550,6 +550,31 @@ fn read_object(obj: &str, validation_level: i8) -> PyResult<PyRoCrate> {
         .map_err(|e| PyIOError::new_err(format!("Failed to read crate: {:#?}", e)))?;
     Ok(PyRoCrate::from(rocrate))
 }
+
+/// Reads a UTF-8 encoded JSON `bytes` object of a crate into memory allowing
+/// manipulation
+///
+/// Avoids round-tripping JSON that is already held as bytes (e.g. HTTP bodies
+/// or file contents) through a Python `str`
+/// # Arguments
+/// * `obj` - UTF-8 encoded bytes of RO-Crate JSON.
+/// * `validation_level` - An integer specifying how strictly the crate is validated.
+///                        0-2, 0 no validation, 1 warnings, 2 strict
+///
+/// # Errors
+/// Raises an `IOError` if the bytes are not valid UTF-8 or it cannot parse the crate.
+///
+/// # Returns
+/// A `PyRoCrate` on success.
+#[pyfunction]
+fn read_bytes(obj: &[u8], validation_level: i8) -> PyResult<PyRoCrate> {
+    let obj = std::str::from_utf8(obj)
+        .map_err(|e| PyIOError::new_err(format!("Failed to read crate: {:#?}", e)))?;
+    let rocrate = read_crate_obj(obj, validation_level)
+        .map_err(|e| PyIOError::new_err(format!("Failed to read crate: {:#?}", e)))?;
+    Ok(PyRoCrate::from(rocrate))
+}
+
 /// Reads a Zip of a crate into memory allowing manipulation
 ///
 /// Useful for understanding large archives
@@ -714,6 +739,7 @@ fn rocraters(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyRoCrateContext>()?;
     m.add_function(wrap_pyfunction!(read, m)?)?;
     m.add_function(wrap_pyfunction!(read_object, m)?)?;
+    m.add_function(wrap_pyfunction!(read_bytes, m)?)?;
     m.add_function(wrap_pyfunction!(read_zip, m)?)?;
     m.add_function(wrap_pyfunction!(validate, m)?)?;
     m.add_function(wrap_pyfunction!(validate_object, m)?)?;
@@ -0,0 +1,192 @@
+"""
+Shared fixtures for the rocraters Python API tests.
+
+Fixture crates are session-scoped so they are read once per test session
+(or once per worker under pytest-xdist) rather than once per test. Tests
+must treat them as read-only.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+from rocraters import read, read_zip
+
+
+# Fixture paths are resolved relative to this file, so the suite does not
+# depend on the directory pytest is invoked from
+_HERE = Path(__file__).resolve().parent
+FIXTURES_DIR = _HERE.parent / "fixtures"
+REPO_FIXTURES_DIR = _HERE.parents[2] / "tests" / "fixtures"
+
+MIN_JSON = os.fspath(FIXTURES_DIR / "_ro-crate-metadata-minimal.json")
+BROKEN_SCHEMA_JSON = os.fspath(FIXTURES_DIR / "_ro-crate-metadata-broken-schema.json")
+ZIP_FIXTURE = os.fspath(FIXTURES_DIR / "zip_test" / "fixtures.zip")
+EXP_FIXTURE = os.fspath(FIXTURES_DIR / "test_experiment" / "_ro-crate-metadata-minimal.json")
+REPO_MIN_JSON = os.fspath(REPO_FIXTURES_DIR / "_ro-crate-metadata-minimal.json")
+
+# Minified JSON crate for the read_object/read_bytes tests
+CRATE_OBJECT = json.dumps(
+    {
+        "@context": "https://w3id.org/ro/crate/1.1/context",
+        "@graph": [
+            {
+                "@type": "CreativeWork",
+                "@id": "ro-crate-metadata.json",
+                "conformsTo": {"@id": "https://w3id.org/ro/crate/1.1"},
+                "about": {"@id": "./"}
+            },
+            {
+                "@id": "./",
+                "identifier": "https://doi.org/10.4225/59/59672c09f4a4b",
+                "@type": "Dataset",
+                "datePublished": "2017",
+                "name": "Data files associated with the manuscript:Effects of facilitated family case conferencing for ...",
+                "description": "Palliative care planning for nursing home residents with advanced dementia ...",
+                "license": {"@id": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/"}
+            },
+            {
+                "@id": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/",
+                "@type": "CreativeWork",
+                "description": "This work is licensed under the Creative Commons Attribution-NonCommercial-ShareAlike 3.0 Australia License. To view a copy of this license, visit http://creativecommons.org/licenses/by-nc-sa/3.0/au/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.",
+                "identifier": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/",
+                "name": "Attribution-NonCommercial-ShareAlike 3.0 Australia (CC BY-NC-SA 3.0 AU)",
+                "value": None
+            }
+        ]
+    },
+    separators=(",", ":"),
+)
+CRATE_OBJECT_BYTES = CRATE_OBJECT.encode()
+
+
+def _freeze(value):
+    """Recursively wraps dicts in MappingProxyType so nested values are read-only too."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+# Expected entities, deeply read-only so a test cannot leak changes into another
+METADATA_FIXTURE = _freeze({
+    "type": "CreativeWork",
+    "id": "ro-crate-metadata.json",
+    "conformsTo": {"id": "https://w3id.org/ro/crate/1.1"},
+    "about": {"id": "./"}
+})
+
+ROOT_FIXTURE = _freeze({
+    "id": "./",
+    "identifier": "https://doi.org/10.4225/59/59672c09f4a4b",
+    "type": "Dataset",
+    "datePublished": "2017",
+    "name": "Data files associated with the manuscript:Effects of facilitated family case conferencing for ...",
+    "description": "Palliative care planning for nursing home residents with advanced dementia ...",
+    "license": {"id": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/"}
+})
+
+CONTEXTUAL_FIXTURE = _freeze({
+    "id": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/",
+    "type": "CreativeWork",
+    "description": "This work is licensed under the Creative Commons Attribution-NonCommercial-ShareAlike 3.0 Australia License. To view a copy of this license, visit http://creativecommons.org/licenses/by-nc-sa/3.0/au/ or send a letter to Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.",
+    "identifier": "https://creativecommons.org/licenses/by-nc-sa/3.0/au/",
+    "name": "Attribution-NonCommercial-ShareAlike 3.0 Australia (CC BY-NC-SA 3.0 AU)",
+    "value": None
+})
+
+
+def _slurp(path):
+    """Reads a whole file into bytes through a raw fd, bypassing buffered IO."""
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(path, flags)
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+@pytest.fixture(scope="session")
+def min_json():
+    return MIN_JSON
+
+
+@pytest.fixture(scope="session")
+def broken_schema_json():
+    return BROKEN_SCHEMA_JSON
+
+
+@pytest.fixture(scope="session")
+def zip_fixture():
+    return ZIP_FIXTURE
+
+
+@pytest.fixture(scope="session")
+def crate_object():
+    return CRATE_OBJECT
+
+
+@pytest.fixture(scope="session")
+def crate_object_bytes():
+    return CRATE_OBJECT_BYTES
+
+
+@pytest.fixture(scope="session")
+def metadata_fixture():
+    return METADATA_FIXTURE
+
+
+@pytest.fixture(scope="session")
+def root_fixture():
+    return ROOT_FIXTURE
+
+
+@pytest.fixture(scope="session")
+def contextual_fixture():
+    return CONTEXTUAL_FIXTURE
+
+
+@pytest.fixture(scope="session")
+def minimal_bytes():
+    return _slurp(MIN_JSON)
+
+
+@pytest.fixture(scope="session")
+def crate_min0():
+    return read(MIN_JSON, 0)
+
+
+@pytest.fixture(scope="session")
+def crate_min1():
+    return read(MIN_JSON, 1)
+
+
+@pytest.fixture(scope="session")
+def crate_repo_min0():
+    return read(REPO_MIN_JSON, 0)
+
+
+@pytest.fixture(scope="session")
+def crate_zip():
+    return read_zip(ZIP_FIXTURE, 1)
+
+
+@pytest.fixture
+def experiment_dir(tmp_path):
+    """Copy of the test_experiment crate, so zipping never writes into the repo."""
+    source = Path(EXP_FIXTURE).parent
+    target = tmp_path / source.name
+    shutil.copytree(source, target, ignore=shutil.ignore_patterns("*.zip"))
+    # The crate references ../external.txt, keep that relative path resolvable
+    shutil.copy(FIXTURES_DIR / "external.txt", tmp_path / "external.txt")
+    return target